@@ -1,20 +1,22 @@
 """CLI application for shardctl."""
 
+import sys
+from functools import lru_cache, wraps
+from inspect import Parameter, Signature, signature
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
 
 import typer
-from rich.console import Console
-
-from .compose import ComposeManager
-from .config import Config
-from .utils import (
-    build_service,
-    clone_services,
-    create_services_config_example,
-    format_service_status,
-    validate_environment,
-)
+from rich.style import Style
+from rich.text import Text
+from typer.models import OptionInfo
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from .compose import ComposeManager
+    from .config import Config
 
 app = typer.Typer(
     name="shardctl",
@@ -22,10 +24,45 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+# Styles for container states in `status`; anything else is yellow. Typer
+# already imports Rich, so these are parsed once at import time.
+_STATE_STYLE = MappingProxyType({"running": Style.parse("green"), "exited": Style.parse("red")})
+_DEFAULT_STATE_STYLE = Style.parse("yellow")
+
+# Padded, styled state cells shared by every `status` row with that state
+_STATE_TEXT = MappingProxyType({
+    state: Text(f"{state:<10}", style=style) for state, style in _STATE_STYLE.items()
+})
+
+
+@lru_cache(maxsize=None)
+def _get_console(stderr: bool = False) -> "Console":
+    """Get a shared Rich console, creating it on first use.
+
+    Args:
+        stderr: If True, get the console that writes to stderr.
+
+    Returns:
+        Console instance.
+    """
+    from rich.console import Console
+
+    return Console(stderr=stderr)
+
 
+@lru_cache(maxsize=1)
+def _get_config() -> "Config":
+    """Get the configuration for the current directory, shared by all commands.
 
-def get_manager(profile: Optional[str] = None) -> ComposeManager:
+    Returns:
+        Config instance.
+    """
+    from .config import Config
+
+    return Config()
+
+
+def get_manager(profile: Optional[str] = None) -> "ComposeManager":
     """Get a ComposeManager instance with the current configuration.
 
     Args:
@@ -34,11 +71,88 @@ def get_manager(profile: Optional[str] = None) -> ComposeManager:
     Returns:
         ComposeManager instance.
     """
-    config = Config()
-    return ComposeManager(config, profile=profile)
+    from .compose import ComposeManager
+
+    return ComposeManager(_get_config(), profile=profile)
+
+
+def _write_tsv(header: Tuple[str, ...], rows: Iterable[Tuple[str, ...]]) -> None:
+    """Write rows as tab-separated values for scripts reading piped output.
+
+    Args:
+        header: Column names.
+        rows: Rows of column values.
+    """
+    lines = ["\t".join(header)]
+    lines.extend("\t".join(map(str, row)) for row in rows)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _requires_environment(
+    needs_git: bool = False,
+    needs_docker: bool = True
+) -> Callable[[Callable], Callable]:
+    """Decorate a command so it exits early if required tools are missing.
+
+    Args:
+        needs_git: If True, require git.
+        needs_docker: If True, require docker.
+
+    Returns:
+        Command decorator.
+    """
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            from .utils import validate_environment
+
+            if not validate_environment(needs_git=needs_git, needs_docker=needs_docker):
+                raise typer.Exit(1)
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _with_manager(fn: Callable) -> Callable:
+    """Decorate a command that runs compose operations.
+
+    The decorated function takes a ComposeManager as its first parameter. The
+    command gets a --profile option in its place, and the environment is
+    validated before the function runs.
+
+    Args:
+        fn: Command function to decorate.
+
+    Returns:
+        Decorated command.
+    """
+    @_requires_environment()
+    @wraps(fn)
+    def wrapper(*args, profile: Optional[str] = None, **kwargs):
+        return fn(get_manager(profile), *args, **kwargs)
+
+    # Typer builds the command from this signature: drop the manager and put
+    # --profile ahead of the command's own options
+    params = list(signature(fn).parameters.values())[1:]
+    index = next(
+        (i for i, param in enumerate(params) if isinstance(param.default, OptionInfo)),
+        len(params),
+    )
+    params.insert(index, Parameter(
+        "profile",
+        Parameter.POSITIONAL_OR_KEYWORD,
+        default=typer.Option(None, "--profile", "-p", help="Compose profile (dev/prod)"),
+        annotation=Optional[str],
+    ))
+    wrapper.__signature__ = Signature(params)
+    wrapper.__annotations__ = {param.name: param.annotation for param in params}
+    return wrapper
 
 
 @app.command()
+@_requires_environment(needs_git=True, needs_docker=False)
 def clone(
     force: bool = typer.Option(
         False,
@@ -51,6 +165,11 @@ def clone(
         "--all",
         help="Clone all services including disabled ones (default: enabled only)"
     ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Clone full git history instead of a shallow clone"
+    ),
 ):
     """Clone service repositories with their configured branches.
 
@@ -61,13 +180,20 @@ def clone(
     them into the services/ directory. Each service becomes an independent git
     repository that is ignored by the parent integration repo.
 
+    Clones are shallow by default (latest commit only). Use --full for complete
+    history, or set clone_depth for a service in services.yml.
+
     Example:
         shardctl clone              # Clone enabled services only
         shardctl clone --all        # Clone all services (including disabled)
         shardctl clone --force      # Remove and re-clone enabled services
         shardctl clone --all --force  # Remove and re-clone all services
+        shardctl clone --full       # Clone with full git history
     """
-    config = Config()
+    from .utils import clone_services
+
+    console = _get_console()
+    config = _get_config()
 
     # Get service repositories from config (filter by enabled unless --all is specified)
     service_repos = config.get_service_repos(only_enabled=not all_services)
@@ -93,182 +219,170 @@ def clone(
         console.print("[bold blue]Cloning all service repositories (including disabled)...[/bold blue]\n")
     else:
         console.print("[bold blue]Cloning enabled service repositories...[/bold blue]\n")
-    clone_services(service_repos, config.services_dir, force=force)
+    clone_services(service_repos, config.services_dir, force=force, shallow=not full)
     console.print("\n[green]✓[/green] Clone completed")
 
 
 @app.command()
+@_with_manager
 def up(
+    manager: "ComposeManager",
     services: Optional[List[str]] = typer.Argument(None, help="Services to start"),
-    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Compose profile (dev/prod)"),
     foreground: bool = typer.Option(False, "--foreground", "-f", help="Run in foreground"),
     build: bool = typer.Option(False, "--build", "-b", help="Build images before starting"),
 ):
     """Start services (detached by default)."""
-    if not validate_environment():
-        raise typer.Exit(1)
-
-    manager = get_manager(profile)
+    console = _get_console()
     console.print("[bold blue]Starting services...[/bold blue]")
     manager.up(services=services, detached=not foreground, build=build)
     console.print("[green]✓[/green] Services started successfully")
 
 
 @app.command()
+@_with_manager
 def down(
-    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Compose profile (dev/prod)"),
+    manager: "ComposeManager",
     volumes: bool = typer.Option(False, "--volumes", "-v", help="Remove named volumes"),
     keep_orphans: bool = typer.Option(False, "--keep-orphans", help="Keep orphan containers"),
 ):
     """Stop and remove services."""
-    if not validate_environment():
-        raise typer.Exit(1)
-
-    manager = get_manager(profile)
+    console = _get_console()
     console.print("[bold blue]Stopping services...[/bold blue]")
     manager.down(volumes=volumes, remove_orphans=not keep_orphans)
     console.print("[green]✓[/green] Services stopped successfully")
 
 
 @app.command()
+@_with_manager
 def ps(
+    manager: "ComposeManager",
     services: Optional[List[str]] = typer.Argument(None, help="Services to list"),
-    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Compose profile (dev/prod)"),
 ):
     """List running containers."""
-    if not validate_environment():
-        raise typer.Exit(1)
-
-    manager = get_manager(profile)
     manager.ps(services=services)
 
 
 @app.command()
+@_with_manager
 def logs(
+    manager: "ComposeManager",
     services: Optional[List[str]] = typer.Argument(None, help="Services to show logs for"),
-    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Compose profile (dev/prod)"),
     follow: bool = typer.Option(False, "--follow", "-f", help="Follow log output"),
     tail: Optional[int] = typer.Option(None, "--tail", "-n", help="Number of lines to show"),
 ):
     """View service logs."""
-    if not validate_environment():
-        raise typer.Exit(1)
-
-    manager = get_manager(profile)
     manager.logs(services=services, follow=follow, tail=tail)
 
 
 @app.command()
+@_with_manager
 def restart(
+    manager: "ComposeManager",
     services: Optional[List[str]] = typer.Argument(None, help="Services to restart"),
-    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Compose profile (dev/prod)"),
 ):
     """Restart services."""
-    if not validate_environment():
-        raise typer.Exit(1)
-
-    manager = get_manager(profile)
+    console = _get_console()
     console.print("[bold blue]Restarting services...[/bold blue]")
     manager.restart(services=services)
     console.print("[green]✓[/green] Services restarted successfully")
 
 
 @app.command()
+@_with_manager
 def build(
+    manager: "ComposeManager",
     services: Optional[List[str]] = typer.Argument(None, help="Services to build"),
-    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Compose profile (dev/prod)"),
     no_cache: bool = typer.Option(False, "--no-cache", help="Do not use cache when building"),
 ):
     """Build or rebuild service images."""
-    if not validate_environment():
-        raise typer.Exit(1)
-
-    manager = get_manager(profile)
+    console = _get_console()
     console.print("[bold blue]Building services...[/bold blue]")
     manager.build(services=services, no_cache=no_cache)
     console.print("[green]✓[/green] Build completed successfully")
 
 
 @app.command()
+@_with_manager
 def pull(
+    manager: "ComposeManager",
     services: Optional[List[str]] = typer.Argument(None, help="Services to pull"),
-    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Compose profile (dev/prod)"),
 ):
     """Pull service images."""
-    if not validate_environment():
-        raise typer.Exit(1)
-
-    manager = get_manager(profile)
+    console = _get_console()
     console.print("[bold blue]Pulling service images...[/bold blue]")
     manager.pull(services=services)
     console.print("[green]✓[/green] Images pulled successfully")
 
 
 @app.command(name="exec")
+@_with_manager
 def exec_command(
+    manager: "ComposeManager",
     service: str = typer.Argument(..., help="Service name"),
     command: List[str] = typer.Argument(..., help="Command to execute"),
-    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Compose profile (dev/prod)"),
     no_tty: bool = typer.Option(False, "--no-tty", "-T", help="Disable pseudo-TTY allocation"),
 ):
     """Execute a command in a running service container."""
-    if not validate_environment():
-        raise typer.Exit(1)
-
-    manager = get_manager(profile)
-    manager.exec(service, command, interactive=not no_tty)
+    manager.exec(service=service, command=command, interactive=not no_tty)
 
 
 @app.command()
+@_with_manager
 def shell(
+    manager: "ComposeManager",
     service: str = typer.Argument(..., help="Service name"),
-    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Compose profile (dev/prod)"),
     shell_cmd: str = typer.Option("/bin/bash", "--shell", "-s", help="Shell to use"),
 ):
     """Open an interactive shell in a running service container."""
-    if not validate_environment():
-        raise typer.Exit(1)
-
-    manager = get_manager(profile)
+    console = _get_console()
     console.print(f"[dim]Opening shell in {service}...[/dim]")
-    manager.shell(service, shell_cmd=shell_cmd)
+    manager.shell(service=service, shell_cmd=shell_cmd)
 
 
 @app.command()
-def status(
-    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Compose profile (dev/prod)"),
-):
-    """Display service status."""
-    if not validate_environment():
-        raise typer.Exit(1)
+@_with_manager
+def status(manager: "ComposeManager"):
+    """Display service status.
+
+    When stdout is not a terminal, prints tab-separated values instead.
+    """
+    from .utils import format_service_status
 
-    manager = get_manager(profile)
+    console = _get_console()
     services = manager.get_status()
 
+    # Piped output stays pure TSV: header only when empty, notice on stderr
+    if not sys.stdout.isatty():
+        _write_tsv(
+            ("NAME", "SERVICE", "STATE", "STATUS", "PORTS"),
+            (format_service_status(service_info) for service_info in services),
+        )
+        if not services:
+            _get_console(stderr=True).print("[yellow]No running services found[/yellow]")
+        return
+
     if not services:
         console.print("[yellow]No running services found[/yellow]")
         return
 
+    # Known states come from _STATE_TEXT; others are built once per call
+    state_texts: Dict[str, Text] = dict(_STATE_TEXT)
+
     for service_info in services:
-        formatted = format_service_status(service_info)
-
-        # Color code the state
-        state = formatted["State"]
-        if state == "running":
-            state_color = "green"
-        elif state == "exited":
-            state_color = "red"
-        else:
-            state_color = "yellow"
+        row = format_service_status(service_info)
 
-        # Simple line format: NAME SERVICE STATE STATUS PORTS
-        console.print(
-            f"{formatted['Name']:<30} "
-            f"{formatted['Service']:<20} "
-            f"[{state_color}]{state:<10}[/{state_color}] "
-            f"{formatted['Status']:<30} "
-            f"{formatted['Ports']}"
-        )
+        state_text = state_texts.get(row.state)
+        if state_text is None:
+            state_text = Text(f"{row.state:<10}", style=_DEFAULT_STATE_STYLE)
+            state_texts[row.state] = state_text
+
+        # Simple line format: NAME SERVICE STATE STATUS PORTS, with the state
+        # color coded. Built as Text so Rich doesn't parse markup for each row.
+        console.print(Text.assemble(
+            f"{row.name:<30} {row.service:<20} ",
+            state_text,
+            f" {row.status:<30} {row.ports}",
+        ))
 
 
 @app.command()
@@ -284,6 +398,11 @@ def setup(
         "--all",
         help="Clone all services including disabled ones (default: enabled only)"
     ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Clone full git history instead of a shallow clone"
+    ),
     create_config: bool = typer.Option(
         False,
         "--create-config",
@@ -298,8 +417,14 @@ def setup(
     This command reads repository URLs from services.yml and clones them
     into the services/ directory. Each service becomes an independent git
     repository that is ignored by the parent integration repo.
+
+    Clones are shallow by default (latest commit only). Use --full for complete
+    history, or set clone_depth for a service in services.yml.
     """
-    config = Config()
+    from .utils import clone_services, create_services_config_example, validate_environment
+
+    console = _get_console()
+    config = _get_config()
 
     # Create example config if requested
     if create_config:
@@ -313,6 +438,9 @@ def setup(
             create_services_config_example(services_config_file)
         return
 
+    if not validate_environment(needs_git=True, needs_docker=False):
+        raise typer.Exit(1)
+
     # Get service repositories from config (filter by enabled unless --all is specified)
     service_repos = config.get_service_repos(only_enabled=not all_services)
 
@@ -337,7 +465,7 @@ def setup(
         console.print("[bold blue]Setting up all service repositories (including disabled)...[/bold blue]\n")
     else:
         console.print("[bold blue]Setting up enabled service repositories...[/bold blue]\n")
-    clone_services(service_repos, config.services_dir, force=force)
+    clone_services(service_repos, config.services_dir, force=force, shallow=not full)
     console.print("\n[green]✓[/green] Setup completed")
 
 
@@ -378,27 +506,52 @@ def build_service_cmd(
         shardctl build-service --list             # List enabled services
         shardctl build-service --list --all       # List all services (including disabled)
     """
-    config = Config()
+    from .utils import build_service, validate_environment
+
+    console = _get_console()
+    config = _get_config()
 
     # List services if requested
     if list_services:
         # Use all_services flag to determine if we show disabled services
         build_configs = config.get_all_build_configs(only_enabled=not all_services)
+        piped = not sys.stdout.isatty()
+
+        if piped:
+            _write_tsv(
+                ("SERVICE", "ENVIRONMENT", "BUILD", "DOCKER"),
+                (
+                    (
+                        svc_name,
+                        cfg.get("environment") or "default",
+                        cfg.get("build_command") or "N/A",
+                        cfg.get("docker_build_command") or "N/A",
+                    )
+                    for svc_name, cfg in build_configs.items()
+                ),
+            )
+
         if not build_configs:
+            # Piped output stays pure TSV: header only when empty, notice on stderr
+            notice_console = _get_console(stderr=True) if piped else console
             if all_services:
-                console.print("[yellow]No build configurations found in services.yml[/yellow]")
+                notice_console.print("[yellow]No build configurations found in services.yml[/yellow]")
             else:
-                console.print(
+                notice_console.print(
                     "[yellow]No enabled services with build configurations found[/yellow]\n"
                     "[dim]Use --all to see disabled services[/dim]"
                 )
             return
 
+        if piped:
+            return
+
         # Simple list output - one service per line
         for svc_name, cfg in build_configs.items():
-            build_cmd = cfg.get("build_command", "N/A")
-            docker_cmd = cfg.get("docker_build_command", "N/A")
-            env = cfg.get("environment", "default")
+            get = cfg.get
+            build_cmd = get("build_command") or "N/A"
+            docker_cmd = get("docker_build_command") or "N/A"
+            env = get("environment") or "default"
 
             # Format: SERVICE_NAME (env: ENVIRONMENT)
             console.print(f"[cyan]{svc_name}[/cyan] [dim](env: {env})[/dim]")
@@ -409,6 +562,9 @@ def build_service_cmd(
 
         return
 
+    if not validate_environment(needs_git=True, needs_docker=False):
+        raise typer.Exit(1)
+
     # Build all enabled services if -a/--all is specified without a service name
     if all_services and not service:
         build_configs = config.get_all_build_configs(only_enabled=True)
@@ -499,9 +655,10 @@ def build_service_cmd(
 
 
 @app.command()
+@_with_manager
 def compose(
+    manager: "ComposeManager",
     args: List[str] = typer.Argument(..., help="Docker compose command and arguments"),
-    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Compose profile (dev/prod)"),
 ):
     """Run a custom docker-compose command with arguments.
 
@@ -510,11 +667,7 @@ def compose(
 
     Example: shardctl compose config --services
     """
-    if not validate_environment():
-        raise typer.Exit(1)
-
-    manager = get_manager(profile)
-    manager.run_custom_command(args)
+    manager.run_custom_command(args=args)
 
 
 @app.callback()
@@ -528,5 +681,106 @@ def main():
     pass
 
 
-if __name__ == "__main__":
+# Commands handled by _fast_dispatch without building the Click command tree.
+# Each entry is (command function, accepts positional services, flags), where
+# flags maps an option to (parameter name, value converter or None for booleans).
+_FlagSpec = Dict[str, Tuple[str, Optional[Callable[[str], object]]]]
+
+_PROFILE_FLAGS: _FlagSpec = {"--profile": ("profile", str), "-p": ("profile", str)}
+
+_FAST_COMMANDS: Dict[str, Tuple[Callable, bool, _FlagSpec]] = {
+    "up": (up, True, {
+        **_PROFILE_FLAGS,
+        "--foreground": ("foreground", None),
+        "-f": ("foreground", None),
+        "--build": ("build", None),
+        "-b": ("build", None),
+    }),
+    "down": (down, False, {
+        **_PROFILE_FLAGS,
+        "--volumes": ("volumes", None),
+        "-v": ("volumes", None),
+        "--keep-orphans": ("keep_orphans", None),
+    }),
+    "ps": (ps, True, _PROFILE_FLAGS),
+    "logs": (logs, True, {
+        **_PROFILE_FLAGS,
+        "--follow": ("follow", None),
+        "-f": ("follow", None),
+        "--tail": ("tail", int),
+        "-n": ("tail", int),
+    }),
+    "restart": (restart, True, _PROFILE_FLAGS),
+    "build": (build, True, {**_PROFILE_FLAGS, "--no-cache": ("no_cache", None)}),
+    "pull": (pull, True, _PROFILE_FLAGS),
+    "status": (status, False, _PROFILE_FLAGS),
+}
+
+
+def _fast_dispatch(argv: List[str]) -> bool:
+    """Run a hot command straight from argv, bypassing Click parsing.
+
+    Only plain invocations of the commands in _FAST_COMMANDS are handled.
+    Anything else (--help, unknown flags, --option=value forms, bad values)
+    is left for Typer so it can report errors as usual.
+
+    Args:
+        argv: Command-line arguments, excluding the program name.
+
+    Returns:
+        True if the command was dispatched, False if Typer should handle it.
+    """
+    if not argv or argv[0] not in _FAST_COMMANDS:
+        return False
+
+    command, takes_services, flags = _FAST_COMMANDS[argv[0]]
+    kwargs = {name: None if convert else False for name, convert in flags.values()}
+    services = []
+
+    args = iter(argv[1:])
+    for arg in args:
+        if not arg.startswith("-"):
+            if not takes_services:
+                return False
+            services.append(arg)
+            continue
+
+        if arg not in flags:
+            return False
+
+        name, convert = flags[arg]
+        if convert is None:
+            kwargs[name] = True
+            continue
+
+        value = next(args, None)
+        if value is None:
+            return False
+        try:
+            kwargs[name] = convert(value)
+        except ValueError:
+            return False
+
+    if takes_services:
+        kwargs["services"] = services or None
+
+    command(**kwargs)
+    return True
+
+
+def run() -> None:
+    """Entry point for the shardctl console script."""
+    try:
+        if _fast_dispatch(sys.argv[1:]):
+            return
+    except typer.Exit as e:
+        sys.exit(e.exit_code)
+    except KeyboardInterrupt:
+        typer.echo("Aborted!", err=True)
+        sys.exit(1)
+
     app()
+
+
+if __name__ == "__main__":
+    run()
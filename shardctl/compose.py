@@ -10,6 +10,8 @@ from rich.console import Console
 from .config import Config
 
 console = Console()
+# Captured commands and their warnings are printed here, keeping stdout clean for callers
+err_console = Console(stderr=True)
 
 
 class ComposeManager:
@@ -59,23 +61,32 @@ class ComposeManager:
 
         Returns:
             CompletedProcess instance.
+
+        Raises:
+            SystemExit: If the docker binary cannot be found.
         """
         full_command = self._build_base_command() + command
 
-        console.print(f"[dim]$ {' '.join(full_command)}[/dim]")
+        echo_console = err_console if capture_output else console
+        echo_console.print(f"[dim]$ {' '.join(full_command)}[/dim]")
 
-        if capture_output:
-            result = subprocess.run(
-                full_command,
-                capture_output=True,
-                text=True,
-                check=check
-            )
-        else:
-            result = subprocess.run(
-                full_command,
-                check=check
-            )
+        try:
+            if capture_output:
+                result = subprocess.run(
+                    full_command,
+                    capture_output=True,
+                    text=True,
+                    check=check
+                )
+            else:
+                result = subprocess.run(
+                    full_command,
+                    check=check
+                )
+        except FileNotFoundError:
+            # docker went missing after validate_environment() found it
+            err_console.print("[red]Error: docker-compose is not installed or not in PATH[/red]")
+            raise SystemExit(1)
 
         return result
 
@@ -263,8 +274,8 @@ class ComposeManager:
             return services
 
         except subprocess.CalledProcessError:
-            console.print("[yellow]Warning: Could not get service status[/yellow]")
+            err_console.print("[yellow]Warning: Could not get service status[/yellow]")
             return []
         except Exception as e:
-            console.print(f"[yellow]Warning: Error getting service status: {e}[/yellow]")
+            err_console.print(f"[yellow]Warning: Error getting service status: {e}[/yellow]")
             return []
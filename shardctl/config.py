@@ -1,6 +1,7 @@
 """Configuration management for shardctl."""
 
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -20,6 +21,20 @@ class Config:
         self.services_dir = self.root_dir / "services"
         self.compose_file = self.root_dir / "docker-compose.yml"
         self.compose_dev_file = self.root_dir / "docker-compose.dev.yml"
+        self.services_config_file = self.root_dir / "services.yml"
+
+    @cached_property
+    def _services_config(self) -> Dict:
+        """Contents of services.yml, read once per Config instance.
+
+        Returns:
+            Parsed services configuration, or an empty dictionary if there is none.
+        """
+        if not self.services_config_file.exists():
+            return {}
+
+        with open(self.services_config_file, 'r') as f:
+            return yaml.safe_load(f) or {}
 
     @property
     def compose_files(self) -> List[Path]:
@@ -106,26 +121,19 @@ class Config:
         Returns:
             True if service is enabled (or enabled field is missing), False otherwise.
         """
-        services_config_file = self.root_dir / "services.yml"
+        repos = self._services_config.get('repositories', {})
 
-        if not services_config_file.exists():
+        if service_name not in repos:
             return True
 
-        with open(services_config_file, 'r') as f:
-            services_config = yaml.safe_load(f)
-            repos = services_config.get('repositories', {})
-
-            if service_name not in repos:
-                return True
+        repo_config = repos[service_name]
 
-            repo_config = repos[service_name]
-
-            # Handle old format (string URL)
-            if isinstance(repo_config, str):
-                return True
+        # Handle old format (string URL)
+        if isinstance(repo_config, str):
+            return True
 
-            # Handle new format (dict) - default to True if enabled field is missing
-            return repo_config.get('enabled', True)
+        # Handle new format (dict) - default to True if enabled field is missing
+        return repo_config.get('enabled', True)
 
     def get_service_repos(self, only_enabled: bool = True) -> Dict[str, Dict]:
         """Get mapping of service names to their repository configuration.
@@ -137,39 +145,31 @@ class Config:
             Dictionary mapping service names to repository config (url, branch, enabled, etc).
             For backward compatibility, also supports simple string URLs.
         """
-        # Check for services.yml configuration
-        services_config_file = self.root_dir / "services.yml"
-
-        if services_config_file.exists():
-            with open(services_config_file, 'r') as f:
-                services_config = yaml.safe_load(f)
-                repos = services_config.get('repositories', {})
-
-                # Normalize to dict format
-                normalized = {}
-                for name, config in repos.items():
-                    if isinstance(config, str):
-                        # Old format: just URL string
-                        normalized[name] = {'url': config, 'branch': None, 'enabled': True}
-                    else:
-                        # New format: dict with url and branch
-                        # Default enabled to True if not specified
-                        service_config = config.copy()
-                        if 'enabled' not in service_config:
-                            service_config['enabled'] = True
-                        normalized[name] = service_config
-
-                # Filter by enabled status if requested
-                if only_enabled:
-                    normalized = {
-                        name: config
-                        for name, config in normalized.items()
-                        if config.get('enabled', True)
-                    }
-
-                return normalized
-
-        return {}
+        repos = self._services_config.get('repositories', {})
+
+        # Normalize to dict format
+        normalized = {}
+        for name, config in repos.items():
+            if isinstance(config, str):
+                # Old format: just URL string
+                normalized[name] = {'url': config, 'branch': None, 'enabled': True}
+            else:
+                # New format: dict with url and branch
+                # Default enabled to True if not specified
+                service_config = config.copy()
+                if 'enabled' not in service_config:
+                    service_config['enabled'] = True
+                normalized[name] = service_config
+
+        # Filter by enabled status if requested
+        if only_enabled:
+            normalized = {
+                name: config
+                for name, config in normalized.items()
+                if config.get('enabled', True)
+            }
+
+        return normalized
 
     def get_service_build_config(self, service_name: str) -> Optional[Dict]:
         """Get build configuration for a specific service.
@@ -180,15 +180,7 @@ class Config:
         Returns:
             Dictionary with build configuration, or None if not found.
         """
-        services_config_file = self.root_dir / "services.yml"
-
-        if services_config_file.exists():
-            with open(services_config_file, 'r') as f:
-                services_config = yaml.safe_load(f)
-                builds = services_config.get('builds', {})
-                return builds.get(service_name)
-
-        return None
+        return self._services_config.get('builds', {}).get(service_name)
 
     def get_all_build_configs(self, only_enabled: bool = True) -> Dict[str, Dict]:
         """Get all service build configurations.
@@ -199,41 +191,18 @@ class Config:
         Returns:
             Dictionary mapping service names to their build configurations.
         """
-        services_config_file = self.root_dir / "services.yml"
-
-        if services_config_file.exists():
-            with open(services_config_file, 'r') as f:
-                services_config = yaml.safe_load(f)
-                builds = services_config.get('builds', {})
-
-                # Filter by enabled status if requested
-                if only_enabled:
-                    # Get repositories to check enabled status
-                    repos = services_config.get('repositories', {})
-                    filtered_builds = {}
-
-                    for service_name, build_config in builds.items():
-                        # Check if service exists in repositories
-                        if service_name in repos:
-                            repo_config = repos[service_name]
-                            # Handle old format (string URL)
-                            if isinstance(repo_config, str):
-                                is_enabled = True
-                            else:
-                                # Handle new format (dict) - default to True
-                                is_enabled = repo_config.get('enabled', True)
-
-                            if is_enabled:
-                                filtered_builds[service_name] = build_config
-                        else:
-                            # Service not in repositories - include it (for services that only have builds)
-                            filtered_builds[service_name] = build_config
-
-                    return filtered_builds
-
-                return builds
-
-        return {}
+        builds = self._services_config.get('builds', {})
+
+        # Filter by enabled status if requested
+        if only_enabled:
+            # Services that only have builds (not in repositories) are always included
+            return {
+                service_name: build_config
+                for service_name, build_config in builds.items()
+                if self.is_service_enabled(service_name)
+            }
+
+        return builds
 
     def ensure_services_dir(self):
         """Ensure services directory exists."""
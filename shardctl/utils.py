@@ -1,26 +1,285 @@
 """Utility functions for shardctl."""
 
+import os
+import re
+import shutil
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
 
 console = Console()
 
+# Upper bound on concurrent git clones in clone_services
+_MAX_CLONE_WORKERS = 8
+
+# Percentage in `git clone --progress` output, and how much other stderr to keep
+_GIT_PERCENT_RE = re.compile(r"(\d+)%")
+_GIT_STDERR_TAIL = 20
+
+# Shown when a clone that was not allowed to prompt fails
+_BATCH_CLONE_HINT = (
+    "Repositories cloned in parallel cannot prompt for credentials or host keys. "
+    "Load your SSH key into an agent (ssh-add) and accept the host key "
+    "(e.g. ssh -T git@github.com), then try again."
+)
+
+# Default clone mode: latest commit of the configured branch, blobs fetched on demand
+_SHALLOW_CLONE_ARGS = ("--depth=1", "--filter=blob:none", "--single-branch")
+
+# Separator between published and target port in format_ports
+_PORT_ARROW = "→"
+
+# Shared stand-in for services that publish no ports
+_EMPTY_PUBS: Tuple[Dict, ...] = ()
+
+# Written by create_services_config_example
+_EXAMPLE_SERVICES_YML = """# Service repositories configuration
+# Map service names to their git repository URLs
+
+repositories:
+  service-1: https://github.com/your-org/service-1.git
+  service-2: https://github.com/your-org/service-2.git
+  # Add more services as needed
+"""
+
+
+class ServiceRow(NamedTuple):
+    """Service status information formatted for display."""
+
+    name: str
+    service: str
+    state: str
+    status: str
+    ports: str
+
+
+def _parse_repo_config(repo_config: Union[Dict, str]) -> Tuple[str, Optional[str]]:
+    """Extract the repository URL and branch from a repository config.
+
+    Args:
+        repo_config: Repository config dictionary (url, branch) or a plain URL string.
+
+    Returns:
+        Tuple of (repository URL, branch or None).
+    """
+    if isinstance(repo_config, dict):
+        return repo_config.get('url', repo_config), repo_config.get('branch')
+    return repo_config, None
+
+
+def _clone_message(service_name: str, repo_config: Union[Dict, str]) -> str:
+    """Describe a pending clone for progress output.
+
+    Args:
+        service_name: Name of the service.
+        repo_config: Repository config dictionary (url, branch) or a plain URL string.
+
+    Returns:
+        Message such as "Cloning f1r3node (main)".
+    """
+    _, branch = _parse_repo_config(repo_config)
+    if branch:
+        return f"Cloning {service_name} ({branch})"
+    return f"Cloning {service_name}"
+
+
+def _scandir_rmtree(path: str) -> None:
+    """Recursively delete a directory, reading each directory entry once.
+
+    Args:
+        path: Directory to delete.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _scandir_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Remove a directory tree.
+
+    Uses os.scandir directly and falls back to shutil.rmtree for whatever is
+    left if that fails, e.g. on permission errors. A symlink is unlinked
+    without touching what it points to.
+
+    Args:
+        path: Directory to remove.
+    """
+    # os.scandir follows a symlink, so never walk the top-level path through one
+    if path.is_symlink():
+        path.unlink()
+        return
+
+    try:
+        _scandir_rmtree(str(path))
+    except OSError:
+        shutil.rmtree(path)
+
+
+def _clone_depth_args(repo_config: Union[Dict, str], shallow: bool = True) -> List[str]:
+    """Get the git clone arguments that limit how much history is fetched.
+
+    A service's optional ``clone_depth`` in services.yml overrides the default
+    shallow clone: 0 clones full history, N clones the last N commits.
+
+    Args:
+        repo_config: Repository config dictionary (url, branch) or a plain URL string.
+        shallow: If False, always clone full history.
+
+    Returns:
+        List of extra git clone arguments.
+    """
+    if not shallow:
+        return []
+
+    clone_depth = repo_config.get('clone_depth') if isinstance(repo_config, dict) else None
+    if clone_depth is None:
+        return list(_SHALLOW_CLONE_ARGS)
+    if int(clone_depth) <= 0:
+        return []
+    return [f"--depth={int(clone_depth)}", "--single-branch"]
+
+
+def _batch_git_env() -> Dict[str, str]:
+    """Get an environment in which git and ssh fail instead of prompting.
+
+    Returns:
+        Copy of the current environment with prompts disabled.
+    """
+    env = dict(os.environ)
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    env["GIT_SSH_COMMAND"] = f"{env.get('GIT_SSH_COMMAND') or 'ssh'} -o BatchMode=yes"
+    return env
+
+
+def _clone_one(
+    service_name: str,
+    repo_config: Union[Dict, str],
+    services_dir: Path,
+    force: bool = False,
+    shallow: bool = True,
+    progress: Optional["Progress"] = None,
+    task: Optional["TaskID"] = None,
+    batch: bool = False
+) -> Tuple[str, bool, str]:
+    """Clone a single service repository.
+
+    Git's progress output is streamed rather than buffered, and the
+    "Receiving objects" percentage is reported to the given progress task.
+
+    Args:
+        service_name: Name of the service.
+        repo_config: Repository config dictionary (url, branch) or a plain URL string.
+        services_dir: Directory to clone the service into.
+        force: If True, remove an existing service directory before cloning.
+        shallow: If True, clone only recent history unless the service sets clone_depth.
+        progress: Progress display to report clone progress to.
+        task: Task in the progress display that belongs to this service.
+        batch: If True, fail instead of prompting for credentials or host keys.
+
+    Returns:
+        Tuple of (service name, whether it was cloned, status message to print).
+    """
+    service_path = services_dir / service_name
+    repo_url, branch = _parse_repo_config(repo_config)
+
+    # Check if service already exists
+    if service_path.exists():
+        if not force:
+            return (
+                service_name,
+                False,
+                f"[yellow]Service {service_name} already exists, skipping.[/yellow]",
+            )
+        try:
+            _fast_rmtree(service_path)
+        except Exception as e:
+            return service_name, False, f"[red]Error removing {service_name}: {e}[/red]"
+
+    try:
+        # Build git clone command with branch if specified
+        clone_cmd = ["git", "clone", "--progress"]
+        clone_cmd.extend(_clone_depth_args(repo_config, shallow))
+        if branch:
+            clone_cmd.extend(["-b", branch])
+        clone_cmd.extend([repo_url, str(service_path)])
+
+        proc = subprocess.Popen(
+            clone_cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            bufsize=1,
+            env=_batch_git_env() if batch else None
+        )
+
+        try:
+            # Text mode splits git's carriage-return progress updates into lines
+            stderr_tail = deque(maxlen=_GIT_STDERR_TAIL)
+            for line in proc.stderr:
+                match = _GIT_PERCENT_RE.search(line)
+                if match is None:
+                    if line.strip():
+                        stderr_tail.append(line.rstrip())
+                elif progress is not None and line.startswith("Receiving objects"):
+                    progress.update(task, completed=int(match.group(1)), total=100)
+
+            proc.wait()
+        finally:
+            # Don't leave git writing into service_path if reading its output failed
+            if proc.returncode is None:
+                proc.kill()
+                proc.wait()
+            proc.stderr.close()
+    except Exception as e:
+        return service_name, False, f"[red]✗ Error cloning {service_name}: {e}[/red]"
+
+    if proc.returncode != 0:
+        stderr = "\n".join(stderr_tail)
+        if batch:
+            stderr += f"\n{_BATCH_CLONE_HINT}"
+        return (
+            service_name,
+            False,
+            f"[red]✗ Failed to clone {service_name}[/red]\n[dim]{stderr}[/dim]",
+        )
+
+    success_msg = f"[green]✓[/green] Cloned {service_name}"
+    if branch:
+        success_msg += f" [dim]({branch})[/dim]"
+    return service_name, True, success_msg
+
 
 def clone_services(
     service_repos: Dict[str, Dict],
     services_dir: Path,
-    force: bool = False
+    force: bool = False,
+    shallow: bool = True
 ) -> None:
     """Clone service repositories into the services directory.
 
+    Repositories are cloned concurrently, up to _MAX_CLONE_WORKERS at a time.
+    Concurrent clones share the terminal with the progress display, so git and
+    ssh are not allowed to prompt; a single repository is cloned interactively.
+
     Args:
         service_repos: Dictionary mapping service names to repository config (url, branch).
         services_dir: Directory to clone services into.
         force: If True, remove existing service directories before cloning.
+        shallow: If True, clone only the latest commit of each repository unless a
+            service sets clone_depth. If False, clone full history.
     """
     if not service_repos:
         console.print(
@@ -31,87 +290,70 @@ def clone_services(
 
     services_dir.mkdir(parents=True, exist_ok=True)
 
+    # A single repository needs neither a thread pool nor a live progress display
+    if len(service_repos) == 1:
+        for service_name, repo_config in service_repos.items():
+            console.print(f"{_clone_message(service_name, repo_config)}...")
+            _, _, message = _clone_one(service_name, repo_config, services_dir, force, shallow)
+            console.print(message)
+        return
+
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
         console=console,
+        transient=True,
     ) as progress:
 
-        for service_name, repo_config in service_repos.items():
-            service_path = services_dir / service_name
-
-            # Extract URL and branch
-            repo_url = repo_config.get('url', repo_config) if isinstance(repo_config, dict) else repo_config
-            branch = repo_config.get('branch') if isinstance(repo_config, dict) else None
-
-            # Check if service already exists
-            if service_path.exists():
-                if force:
-                    task = progress.add_task(
-                        f"Removing existing {service_name}...",
-                        total=None
-                    )
-                    try:
-                        import shutil
-                        shutil.rmtree(service_path)
-                        progress.update(task, completed=True)
-                    except Exception as e:
-                        console.print(
-                            f"[red]Error removing {service_name}: {e}[/red]"
-                        )
-                        continue
-                else:
-                    console.print(
-                        f"[yellow]Service {service_name} already exists, skipping.[/yellow]"
-                    )
-                    continue
-
-            # Clone the repository
-            clone_msg = f"Cloning {service_name}"
-            if branch:
-                clone_msg += f" ({branch})"
-            task = progress.add_task(f"{clone_msg}...", total=None)
+        tasks = {
+            service_name: progress.add_task(
+                f"{_clone_message(service_name, repo_config)}...", total=None
+            )
+            for service_name, repo_config in service_repos.items()
+        }
+
+        max_workers = min(_MAX_CLONE_WORKERS, len(service_repos))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _clone_one, service_name, repo_config, services_dir, force,
+                    shallow, progress, tasks[service_name], True
+                )
+                for service_name, repo_config in service_repos.items()
+            ]
+            for future in as_completed(futures):
+                service_name, _, message = future.result()
+                progress.remove_task(tasks[service_name])
+                console.print(message)
 
-            try:
-                # Build git clone command with branch if specified
-                clone_cmd = ["git", "clone"]
-                if branch:
-                    clone_cmd.extend(["-b", branch])
-                clone_cmd.extend([repo_url, str(service_path)])
 
-                result = subprocess.run(
-                    clone_cmd,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                progress.update(task, completed=True)
+def _strict_env_check() -> bool:
+    """Check whether tool checks should run the tools instead of searching $PATH.
 
-                success_msg = f"[green]✓[/green] Cloned {service_name}"
-                if branch:
-                    success_msg += f" [dim]({branch})[/dim]"
-                console.print(success_msg)
+    Returns:
+        True if SHARDCTL_STRICT_ENV_CHECK=1 is set, False otherwise.
+    """
+    return os.environ.get("SHARDCTL_STRICT_ENV_CHECK") == "1"
 
-            except subprocess.CalledProcessError as e:
-                console.print(
-                    f"[red]✗ Failed to clone {service_name}[/red]\n"
-                    f"[dim]{e.stderr}[/dim]"
-                )
-            except Exception as e:
-                console.print(f"[red]✗ Error cloning {service_name}: {e}[/red]")
 
+def _run_version_check(command: List[str]) -> bool:
+    """Run a tool's version command to verify that it works.
 
-def check_docker_compose_installed() -> bool:
-    """Check if docker-compose is installed and available.
+    Args:
+        command: Version command to run.
 
     Returns:
-        True if docker-compose is available, False otherwise.
+        True if the command succeeded, False otherwise.
     """
     try:
-        result = subprocess.run(
-            ["docker", "compose", "version"],
-            capture_output=True,
-            text=True,
+        subprocess.run(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True
         )
         return True
@@ -119,70 +361,89 @@ def check_docker_compose_installed() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def check_docker_compose_installed() -> bool:
+    """Check if docker-compose is installed and available.
+
+    Only looks for the docker binary on $PATH unless SHARDCTL_STRICT_ENV_CHECK=1,
+    in which case `docker compose version` is run.
+
+    Returns:
+        True if docker-compose is available, False otherwise.
+    """
+    if _strict_env_check():
+        return _run_version_check(["docker", "compose", "version"])
+    return shutil.which("docker") is not None
+
+
+@lru_cache(maxsize=1)
 def check_git_installed() -> bool:
     """Check if git is installed and available.
 
+    Only looks for the git binary on $PATH unless SHARDCTL_STRICT_ENV_CHECK=1,
+    in which case `git --version` is run.
+
     Returns:
         True if git is available, False otherwise.
     """
-    try:
-        result = subprocess.run(
-            ["git", "--version"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    if _strict_env_check():
+        return _run_version_check(["git", "--version"])
+    return shutil.which("git") is not None
 
 
-def validate_environment() -> bool:
+@lru_cache(maxsize=None)
+def validate_environment(needs_git: bool = False, needs_docker: bool = True) -> bool:
     """Validate that required tools are installed.
 
+    Args:
+        needs_git: If True, require git (for commands that clone or build).
+        needs_docker: If True, require docker (for commands that run compose).
+
     Returns:
         True if environment is valid, False otherwise.
     """
     valid = True
 
-    if not check_docker_compose_installed():
+    if needs_docker and not check_docker_compose_installed():
         console.print(
             "[red]Error: docker-compose is not installed or not in PATH[/red]"
         )
         valid = False
 
-    if not check_git_installed():
+    if needs_git and not check_git_installed():
         console.print(
-            "[yellow]Warning: git is not installed or not in PATH[/yellow]\n"
-            "[dim]Git is required for the setup command.[/dim]"
+            "[red]Error: git is not installed or not in PATH[/red]\n"
+            "[dim]Git is required to clone and build service repositories.[/dim]"
         )
+        valid = False
 
     return valid
 
 
-def format_service_status(service_info: dict) -> Dict[str, str]:
+def format_service_status(service_info: dict) -> ServiceRow:
     """Format service status information for display.
 
     Args:
         service_info: Service information from docker-compose ps.
 
     Returns:
-        Formatted service information dictionary.
+        Formatted service information.
     """
-    return {
-        "Name": service_info.get("Name", "N/A"),
-        "Service": service_info.get("Service", "N/A"),
-        "State": service_info.get("State", "N/A"),
-        "Status": service_info.get("Status", "N/A"),
-        "Ports": format_ports(service_info.get("Publishers", [])),
-    }
+    get = service_info.get
+    return ServiceRow(
+        get("Name", "N/A"),
+        get("Service", "N/A"),
+        get("State", "N/A"),
+        get("Status", "N/A"),
+        format_ports(get("Publishers") or _EMPTY_PUBS),
+    )
 
 
-def format_ports(publishers: list) -> str:
+def format_ports(publishers: Sequence[Dict] = _EMPTY_PUBS) -> str:
     """Format port mappings for display.
 
     Args:
-        publishers: List of port publisher dictionaries.
+        publishers: Sequence of port publisher dictionaries.
 
     Returns:
         Formatted port string.
@@ -190,14 +451,13 @@ def format_ports(publishers: list) -> str:
     if not publishers:
         return "N/A"
 
-    port_strs = []
-    for pub in publishers:
-        published_port = pub.get("PublishedPort", "")
-        target_port = pub.get("TargetPort", "")
-        if published_port and target_port:
-            port_strs.append(f"{published_port}→{target_port}")
+    port_strs = (
+        f"{pub['PublishedPort']}{_PORT_ARROW}{pub['TargetPort']}"
+        for pub in publishers
+        if pub.get("PublishedPort") and pub.get("TargetPort")
+    )
 
-    return ", ".join(port_strs) if port_strs else "N/A"
+    return ", ".join(port_strs) or "N/A"
 
 
 def build_service(
@@ -251,7 +511,8 @@ def build_service(
         try:
             subprocess.run(
                 ["nix", "--version"],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True
             )
             use_nix = True
@@ -336,18 +597,8 @@ def create_services_config_example(config_path: Path) -> None:
     Args:
         config_path: Path where to create the configuration file.
     """
-    example_content = """# Service repositories configuration
-# Map service names to their git repository URLs
-
-repositories:
-  service-1: https://github.com/your-org/service-1.git
-  service-2: https://github.com/your-org/service-2.git
-  # Add more services as needed
-"""
-
     try:
-        with open(config_path, 'w') as f:
-            f.write(example_content)
+        config_path.write_text(_EXAMPLE_SERVICES_YML, encoding="utf-8")
         console.print(f"[green]Created example configuration at {config_path}[/green]")
     except Exception as e:
         console.print(f"[red]Error creating configuration file: {e}[/red]")
@@ -0,0 +1,80 @@
+"""Tests for the argv fast path in shardctl.cli."""
+
+import click
+import pytest
+import typer.main
+
+from shardctl import cli
+
+
+def _click_commands():
+    """Build the Click command tree that Typer would run."""
+    return typer.main.get_command(cli.app).commands
+
+
+@pytest.mark.parametrize("name", sorted(cli._FAST_COMMANDS))
+def test_fast_command_flags_match_typer(name):
+    _, takes_services, flags = cli._FAST_COMMANDS[name]
+    command = _click_commands()[name]
+
+    options = {}
+    for param in command.params:
+        if isinstance(param, click.Option):
+            for opt in param.opts + param.secondary_opts:
+                options[opt] = param
+
+    assert set(flags) == set(options) - {"--help"}
+    for opt, (param_name, convert) in flags.items():
+        param = options[opt]
+        assert param_name == param.name
+        assert (convert is None) == param.is_flag
+        if convert is int:
+            assert param.type is click.INT
+
+    arguments = [param for param in command.params if isinstance(param, click.Argument)]
+    assert takes_services == bool(arguments)
+    if arguments:
+        assert [param.name for param in arguments] == ["services"]
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Replace every fast command with a recorder of the arguments it gets."""
+    recorded = []
+    for name, (_, takes_services, flags) in list(cli._FAST_COMMANDS.items()):
+        monkeypatch.setitem(
+            cli._FAST_COMMANDS,
+            name,
+            (lambda name=name, **kwargs: recorded.append((name, kwargs)), takes_services, flags),
+        )
+    return recorded
+
+
+def test_dispatches_plain_invocation(calls):
+    assert cli._fast_dispatch(["logs", "-n", "5", "--follow", "web", "-p", "dev"])
+    assert calls == [
+        ("logs", {"profile": "dev", "follow": True, "tail": 5, "services": ["web"]}),
+    ]
+
+
+def test_dispatches_without_arguments(calls):
+    assert cli._fast_dispatch(["down"])
+    assert calls == [
+        ("down", {"profile": None, "volumes": False, "keep_orphans": False}),
+    ]
+
+
+@pytest.mark.parametrize("argv", [
+    [],
+    ["clone"],
+    ["up", "--help"],
+    ["logs", "--tail=5"],
+    ["logs", "--tail", "five"],
+    ["logs", "--tail"],
+    ["up", "--unknown"],
+    ["down", "extra"],
+    ["status", "extra"],
+])
+def test_falls_back_to_typer(calls, argv):
+    assert not cli._fast_dispatch(argv)
+    assert calls == []